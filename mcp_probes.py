@@ -0,0 +1,26 @@
+"""Shared execute_operation payloads for the workspace check scripts.
+
+Built once and exported as read-only proxies so every harness passes
+the same interned payload instead of rebuilding the dict literal, and
+none of them can mutate what the others see.
+"""
+
+import types
+
+DB_STATS_PROBE = types.MappingProxyType(
+    {
+        "domain": "data",
+        "operation": "check",
+        "target": "database_stats",
+        "action_params": {},
+    }
+)
+
+PORTS_PROBE = types.MappingProxyType(
+    {
+        "domain": "system",
+        "operation": "check",
+        "target": "ports",
+        "action_params": {"ports": [5432, 5000]},
+    }
+)
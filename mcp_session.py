@@ -0,0 +1,103 @@
+"""Shared persistent MCP session for the stdio test harnesses.
+
+The MCP scripts used to boot their own server subprocess per run and
+ping-pong one JSON-RPC request at a time. This module keeps a single
+server process alive for the whole test session and dispatches requests
+in pipelined batches: all requests are written and flushed at once, then
+the matching number of response lines is read back and keyed by id.
+"""
+
+import atexit
+import json
+import subprocess
+import sys
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads  # accepts bytes/str, tolerates the trailing newline
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+SERVER_SCRIPT = "mcp_universal_operations.py"
+
+
+class MCPSession:
+    """One long-lived MCP server subprocess with batched JSON-RPC dispatch."""
+
+    def __init__(self, server_script=SERVER_SCRIPT):
+        self.process = subprocess.Popen(
+            [sys.executable, server_script, "--mcp"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        self._next_id = 0
+
+    def _new_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    def request_batch(self, calls):
+        """Send several (method, params) calls in one write; return by id.
+
+        The whole batch is flushed before any response is read, so the
+        server never sits idle waiting for the driver between requests.
+        """
+        requests = [
+            {"jsonrpc": "2.0", "id": self._new_id(), "method": method, "params": params}
+            for method, params in calls
+        ]
+        payload = "".join(_dumps(r) + "\n" for r in requests)
+        self.process.stdin.write(payload)
+        self.process.stdin.flush()
+
+        responses = {}
+        for _ in requests:
+            line = self.process.stdout.readline()
+            if not line:
+                raise RuntimeError("MCP server closed its stdout mid-batch")
+            response = _loads(line)
+            responses[response.get("id")] = response
+        return [responses[r["id"]] for r in requests]
+
+    def request(self, method, params=None):
+        """Send a single request and return its response."""
+        return self.request_batch([(method, params or {})])[0]
+
+    def call_tool(self, name, arguments=None):
+        """tools/call helper returning the decoded payload dict."""
+        response = self.request(
+            "tools/call", {"name": name, "arguments": arguments or {}}
+        )
+        content = response.get("result", {}).get("content", [])
+        if content and content[0].get("type") == "text":
+            return _loads(content[0]["text"])
+        return {}
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.terminate()
+            self.process.wait(timeout=5)
+
+
+_session = None
+
+
+def get_session():
+    """Return the session shared by every harness in this process.
+
+    The server subprocess (interpreter startup plus module imports) is
+    paid once no matter how many test scripts run.
+    """
+    global _session
+    if _session is None:
+        _session = MCPSession()
+        atexit.register(_session.close)
+    return _session
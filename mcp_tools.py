@@ -0,0 +1,140 @@
+"""High-level Bible study tools shared by the MCP layer and test drivers."""
+
+import re
+import time
+
+from src.utils.vector_search import (
+    get_verse_by_reference,
+    search_verses_by_semantic_similarity,
+)
+
+_REF_RE = re.compile(r"\b([1-3]?\s?[A-Za-z]+)\s+(\d+):(\d+)\b")
+
+# Recurring theological vocabulary scanned for in retrieved verse text.
+_THEOLOGICAL_TERMS = (
+    "covenant",
+    "faith",
+    "grace",
+    "love",
+    "mercy",
+    "redemption",
+    "righteousness",
+    "salvation",
+    "word",
+)
+
+
+def quick_contextual_insights(query, translation="KJV"):
+    """Build a contextual-insights report for a reference, question or topic.
+
+    Returns a dict with ``input`` (parsed reference and query type),
+    ``insights`` (summary, theological_terms, cross_references,
+    original_language_notes, translation_variants) and
+    ``processing_time_seconds``.
+    """
+    start = time.perf_counter()
+
+    match = _REF_RE.search(query)
+    if match and match.group(0) == query.strip():
+        query_type = "verse"
+    elif "?" in query:
+        query_type = "question"
+    else:
+        query_type = "topic"
+    reference = match.group(0) if match else ""
+
+    verses = search_verses_by_semantic_similarity(
+        query, translation=translation, limit=10
+    )
+
+    summary = ""
+    anchor = None
+    if match:
+        book, chapter, verse = match.groups()
+        anchor = get_verse_by_reference(
+            book.strip(), int(chapter), int(verse), translation
+        )
+    if anchor:
+        summary = anchor["verse_text"]
+    elif verses:
+        summary = verses[0]["verse_text"]
+
+    term_counts = {}
+    for row in verses:
+        text = row["verse_text"].lower()
+        for term in _THEOLOGICAL_TERMS:
+            if term in text:
+                term_counts[term] = term_counts.get(term, 0) + 1
+
+    cross_references = [
+        {
+            "reference": f"{row['book_name']} {row['chapter_num']}:{row['verse_num']}",
+            "text": row["verse_text"],
+            "similarity": row["similarity"],
+        }
+        for row in verses
+    ]
+
+    return {
+        "input": {"reference": reference, "type": query_type, "query": query},
+        "insights": {
+            "summary": summary,
+            "theological_terms": term_counts,
+            "cross_references": cross_references,
+            "original_language_notes": _original_language_notes(reference),
+            "translation_variants": _translation_variants(anchor),
+        },
+        "processing_time_seconds": time.perf_counter() - start,
+    }
+
+
+def _original_language_notes(reference):
+    """Greek/Hebrew word notes for a reference, when the tables exist."""
+    if not reference:
+        return []
+    try:
+        from src.database.connection import get_db_connection
+
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT language, lemma, transliteration, gloss
+                    FROM bible.original_language_words
+                    WHERE reference = %s
+                    ORDER BY word_position
+                    """,
+                    (reference,),
+                )
+                return [
+                    {
+                        "language": language,
+                        "lemma": lemma,
+                        "transliteration": transliteration,
+                        "gloss": gloss,
+                    }
+                    for language, lemma, transliteration, gloss in cursor.fetchall()
+                ]
+    except Exception:
+        return []
+
+
+def _translation_variants(anchor):
+    """The same verse across the loaded translations, when resolvable."""
+    if not anchor:
+        return []
+    variants = []
+    for translation in ("KJV", "ASV"):
+        if translation == anchor["translation_source"]:
+            continue
+        row = get_verse_by_reference(
+            anchor["book_name"],
+            anchor["chapter_num"],
+            anchor["verse_num"],
+            translation,
+        )
+        if row:
+            variants.append(
+                {"translation": translation, "text": row["verse_text"]}
+            )
+    return variants
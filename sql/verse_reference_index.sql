@@ -0,0 +1,6 @@
+-- Composite index matching get_verse_by_reference's WHERE clause, so a
+-- reference lookup is a single index tuple fetch instead of a join plus
+-- scan. Column order follows selectivity as queried: translation first,
+-- then book, chapter, verse.
+CREATE INDEX IF NOT EXISTS idx_verses_reference
+    ON bible.verses (translation_source, book_name, chapter_num, verse_num);
@@ -0,0 +1,22 @@
+"""Primary PostgreSQL connection handling for the Bible database."""
+
+import os
+
+import psycopg
+
+
+def get_connection_string():
+    """Build a libpq connection string from environment variables."""
+    host = os.environ.get("POSTGRES_HOST", "localhost")
+    port = os.environ.get("POSTGRES_PORT", "5432")
+    dbname = os.environ.get("POSTGRES_DB", "bible_db")
+    user = os.environ.get("POSTGRES_USER", "postgres")
+    password = os.environ.get("POSTGRES_PASSWORD", "postgres")
+    return (
+        f"host={host} port={port} dbname={dbname} user={user} password={password}"
+    )
+
+
+def get_db_connection():
+    """Open a new connection to the primary Bible database."""
+    return psycopg.connect(get_connection_string())
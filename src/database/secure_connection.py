@@ -0,0 +1,41 @@
+"""Restricted database connections with explicit read/write modes.
+
+Used as a fallback when the primary connection is unavailable: the read
+role has SELECT-only grants on the ``bible`` schema, so degraded operation
+can never corrupt data.
+"""
+
+import os
+
+import psycopg
+
+
+def get_secure_conninfo(mode="read"):
+    """Build the libpq connection string for the restricted role.
+
+    Args:
+        mode: ``"read"`` for the SELECT-only role, ``"write"`` for the
+            ingestion role.
+
+    Raises:
+        ValueError: if ``mode`` is not ``"read"`` or ``"write"``.
+    """
+    if mode not in ("read", "write"):
+        raise ValueError(f"Unknown connection mode: {mode!r}")
+
+    host = os.environ.get("POSTGRES_HOST", "localhost")
+    port = os.environ.get("POSTGRES_PORT", "5432")
+    dbname = os.environ.get("POSTGRES_DB", "bible_db")
+    if mode == "read":
+        user = os.environ.get("POSTGRES_READ_USER", "bible_reader")
+        password = os.environ.get("POSTGRES_READ_PASSWORD", "")
+    else:
+        user = os.environ.get("POSTGRES_WRITE_USER", "bible_writer")
+        password = os.environ.get("POSTGRES_WRITE_PASSWORD", "")
+
+    return f"host={host} port={port} dbname={dbname} user={user} password={password}"
+
+
+def get_secure_connection(mode="read"):
+    """Open a connection using the restricted role for the given mode."""
+    return psycopg.connect(get_secure_conninfo(mode))
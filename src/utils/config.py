@@ -0,0 +1,32 @@
+"""Configuration helpers for the BibleScholar utilities.
+
+All settings come from environment variables with sensible local-dev
+defaults (LM Studio on localhost, PostgreSQL with the pgvector extension).
+"""
+
+import os
+
+_DEFAULTS = {
+    "lm_studio_api_url": "http://localhost:1234/v1",
+    "embedding_model": "text-embedding-nomic-embed-text-v1.5@q8_0",
+    "default_translation": "KJV",
+}
+
+
+def get_config():
+    """Return the runtime configuration as a dict.
+
+    Environment variables (``LM_STUDIO_API_URL``, ``EMBEDDING_MODEL``,
+    ``DEFAULT_TRANSLATION``) override the built-in defaults.
+    """
+    return {
+        "lm_studio_api_url": os.environ.get(
+            "LM_STUDIO_API_URL", _DEFAULTS["lm_studio_api_url"]
+        ),
+        "embedding_model": os.environ.get(
+            "EMBEDDING_MODEL", _DEFAULTS["embedding_model"]
+        ),
+        "default_translation": os.environ.get(
+            "DEFAULT_TRANSLATION", _DEFAULTS["default_translation"]
+        ),
+    }
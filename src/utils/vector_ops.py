@@ -0,0 +1,81 @@
+"""JIT-compiled numeric kernels for embedding post-processing.
+
+Numba is optional: when it is not installed the kernels run as plain
+NumPy-backed Python, so callers can use one code path either way. The 1D
+and 2D normalizers are deliberately separate functions — a single
+signature taking either shape forces Numba through ``ascontiguousarray``
+unification and fails to compile.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels stay importable without numba."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+
+        return wrap
+
+    prange = range
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def normalize_1d(vec):
+    """L2-normalize a 1D float32 vector in a fused loop."""
+    total = 0.0
+    for j in range(vec.shape[0]):
+        total += vec[j] * vec[j]
+    norm = np.sqrt(total)
+    out = np.empty_like(vec)
+    if norm == 0.0:
+        out[:] = 0.0
+        return out
+    for j in range(vec.shape[0]):
+        out[j] = vec[j] / norm
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def normalize_2d(mat):
+    """L2-normalize each row of a 2D float32 matrix, rows in parallel."""
+    out = np.empty_like(mat)
+    for i in prange(mat.shape[0]):
+        total = 0.0
+        for j in range(mat.shape[1]):
+            total += mat[i, j] * mat[i, j]
+        norm = np.sqrt(total)
+        if norm == 0.0:
+            for j in range(mat.shape[1]):
+                out[i, j] = 0.0
+        else:
+            for j in range(mat.shape[1]):
+                out[i, j] = mat[i, j] / norm
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def cosine_topk(mat, q, k):
+    """Top-k dot-product scores of normalized rows against a normalized query.
+
+    Rows are scored in parallel with SIMD-friendly inner loops. Returns
+    ``(indices, similarities)`` ordered most-similar first.
+    """
+    n = mat.shape[0]
+    sims = np.empty(n, dtype=np.float32)
+    for i in prange(n):
+        total = 0.0
+        for j in range(mat.shape[1]):
+            total += mat[i, j] * q[j]
+        sims[i] = total
+    order = np.argsort(-sims)[:k]
+    return order, sims[order]
@@ -0,0 +1,548 @@
+"""Semantic search over Bible verse embeddings stored in pgvector.
+
+Embeddings are produced by an LM Studio instance exposing the
+OpenAI-compatible ``/v1/embeddings`` endpoint; verse vectors live in
+``bible.verse_embeddings`` and are matched with the pgvector cosine
+distance operator.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import httpx
+import numpy as np
+from pgvector.psycopg import register_vector
+from psycopg import sql
+from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
+
+from src.database.connection import get_connection_string
+from src.database.secure_connection import get_secure_conninfo
+from src.utils import vector_ops
+from src.utils.config import get_config
+from src.utils.semantic_cache import SemanticEmbeddingCache
+
+# Library-style logging: no handlers or file I/O at import time.
+# Applications configure handlers at their entry point (see __main__).
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# LM Studio batches all inputs of one /v1/embeddings call into a single
+# forward pass; 64 keeps request payloads comfortably under its limits.
+MAX_BATCH_SIZE = 64
+
+# One keep-alive HTTP/2 client for all LM Studio traffic: avoids a fresh
+# TCP(+TLS) handshake per embedding call and multiplexes concurrent
+# requests over a single connection.
+_HTTP = httpx.Client(
+    http2=True,
+    timeout=httpx.Timeout(10.0, connect=2.0),
+    limits=httpx.Limits(
+        max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0
+    ),
+)
+
+# Configuration is resolved once at import instead of per call.
+_CONFIG = get_config()
+LM_STUDIO_EMBEDDINGS_URL = f"{_CONFIG['lm_studio_api_url']}/embeddings"
+EMBEDDING_MODEL = _CONFIG["embedding_model"]
+DEFAULT_TRANSLATION = _CONFIG["default_translation"]
+
+
+@dataclass
+class EmbeddingClient:
+    """Resolved embedding endpoint plus the shared HTTP client."""
+
+    url: str = LM_STUDIO_EMBEDDINGS_URL
+    model: str = EMBEDDING_MODEL
+    http: httpx.Client = field(default=_HTTP, repr=False)
+
+    def embed_batch(self, texts):
+        """POST one batch of texts; returns the raw response payload."""
+        response = self.http.post(self.url, json={"model": self.model, "input": texts})
+        response.raise_for_status()
+        return response.json()
+
+
+_EMBEDDING_CLIENT = EmbeddingClient()
+
+
+def get_embeddings(texts, max_batch_size=MAX_BATCH_SIZE):
+    """Embed a list of texts with one HTTP request per batch.
+
+    Texts are sent to LM Studio in batches of ``max_batch_size`` via the
+    OpenAI-compatible ``input: [str, ...]`` form, so N texts cost
+    ceil(N / max_batch_size) round-trips instead of N.
+
+    Args:
+        texts: Texts to embed. Empty/whitespace-only entries are not sent
+            to the server and come back as ``None``.
+        max_batch_size: Maximum number of texts per HTTP request.
+
+    Returns:
+        A list the same length and order as ``texts``; each element is the
+        embedding vector (list of floats) or ``None`` if that text was
+        empty or the request failed.
+    """
+    if max_batch_size < 1:
+        raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+
+    embeddings = [None] * len(texts)
+    # Indices of texts that are actually worth sending.
+    pending = [i for i, t in enumerate(texts) if isinstance(t, str) and t.strip()]
+    if not pending:
+        return embeddings
+
+    for start in range(0, len(pending), max_batch_size):
+        batch_indices = pending[start : start + max_batch_size]
+        try:
+            result = _EMBEDDING_CLIENT.embed_batch([texts[i] for i in batch_indices])
+            # The API may reorder entries; "index" maps each vector back
+            # to its position within this batch.
+            for item in result["data"]:
+                embeddings[batch_indices[item["index"]]] = item["embedding"]
+        except Exception as e:
+            logger.error("Error getting embeddings for batch of %d: %s", len(batch_indices), e)
+
+    return embeddings
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent single-text embedding calls into batched POSTs.
+
+    Callers enqueue a text and block on a Future; a background worker
+    drains up to ``max_batch`` entries or waits ``max_wait_ms`` (whichever
+    comes first) and embeds the whole batch with one request. When K
+    concurrent callers arrive within the window, LM Studio runs one
+    forward pass instead of K.
+    """
+
+    def __init__(self, max_batch=32, max_wait_ms=5.0):
+        self._queue = queue.Queue()
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._worker = threading.Thread(
+            target=self._run, name="embedding-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def embed(self, text):
+        """Queue one text and block until its embedding is available."""
+        future = Future()
+        self._queue.put((text, future))
+        return future.result()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            vectors = get_embeddings([text for text, _ in batch])
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
+
+
+# Repeat queries with near-identical embeddings are answered from this
+# in-process cache without a database round-trip.
+_SEARCH_CACHE = SemanticEmbeddingCache()
+
+# Connection pools are created lazily so importing this module never
+# touches the database. hnsw.ef_search is pinned per-connection so pooled
+# sessions keep the tuned recall/latency trade-off.
+_pool = None
+_fallback_pool = None
+_pool_lock = threading.Lock()
+
+
+def _configure_connection(conn):
+    """Register the pgvector binary adapter on each pooled connection."""
+    register_vector(conn)
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    get_connection_string(),
+                    min_size=2,
+                    max_size=16,
+                    timeout=5,
+                    configure=_configure_connection,
+                    kwargs={"options": "-c hnsw.ef_search=40"},
+                )
+    return _pool
+
+
+def _get_fallback_pool():
+    global _fallback_pool
+    if _fallback_pool is None:
+        with _pool_lock:
+            if _fallback_pool is None:
+                _fallback_pool = ConnectionPool(
+                    get_secure_conninfo(mode="read"),
+                    min_size=1,
+                    max_size=8,
+                    timeout=5,
+                    configure=_configure_connection,
+                    kwargs={"options": "-c hnsw.ef_search=40"},
+                )
+    return _fallback_pool
+
+
+# Primary-pool health: when an acquisition fails, skip the primary (and
+# its exception machinery) entirely until the retry deadline passes.
+_primary_ok = True
+_primary_retry_at = 0.0
+_PRIMARY_RETRY_INTERVAL = 30.0
+
+
+@contextmanager
+def _acquire_read_conn():
+    """Yield a pooled read connection, preferring the primary role.
+
+    Acquisition and fallback happen before the body runs, so exceptions
+    raised by the caller never trigger a spurious failover, and the
+    connection is returned to its pool deterministically on any exit.
+    """
+    global _primary_ok, _primary_retry_at
+    pool = None
+    conn = None
+    now = time.monotonic()
+    if _primary_ok or now >= _primary_retry_at:
+        try:
+            pool = _get_pool()
+            conn = pool.getconn()
+            _primary_ok = True
+        except Exception as e:
+            logger.warning("Primary database pool failed: %s", e)
+            _primary_ok = False
+            _primary_retry_at = now + _PRIMARY_RETRY_INTERVAL
+            pool = None
+            conn = None
+    if conn is None:
+        pool = _get_fallback_pool()
+        conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+
+_batcher = None
+_batcher_lock = threading.Lock()
+
+
+def _get_batcher():
+    global _batcher
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                _batcher = EmbeddingBatcher()
+    return _batcher
+
+
+def get_embedding(text):
+    """Embed a single text; returns the vector or None on failure."""
+    return _get_batcher().embed(text)
+
+
+# The translation census is observability, not search input: cache it
+# with a TTL so it can never cost an aggregate scan per query.
+_translation_stats = None
+_translation_stats_expiry = 0.0
+_TRANSLATION_STATS_TTL = 600.0
+
+
+def get_available_translations():
+    """Return ((translation, verse_count), ...) with a 10-minute cache."""
+    global _translation_stats, _translation_stats_expiry
+    now = time.monotonic()
+    if _translation_stats is not None and now < _translation_stats_expiry:
+        return _translation_stats
+    try:
+        with _acquire_read_conn() as conn:
+            rows = _fetch_translation_counts(conn)
+    except Exception as e:
+        logger.error("Error listing available translations: %s", e)
+        return _translation_stats or ()
+    _translation_stats = tuple(rows)
+    _translation_stats_expiry = now + _TRANSLATION_STATS_TTL
+    return _translation_stats
+
+
+def log_available_translations():
+    """Log which translations have embeddings and how many verses each has."""
+    for translation, count in get_available_translations():
+        logger.info("Available translation: %s (%d verses)", translation, count)
+
+
+def _fetch_translation_counts(conn):
+    with conn.cursor(binary=True) as cursor:
+        cursor.execute(
+            """
+            SELECT translation_source, COUNT(*)
+            FROM bible.verse_embeddings
+            GROUP BY translation_source
+            """
+        )
+        return cursor.fetchall()
+
+
+def search_verses_by_semantic_similarity(query, translation="KJV", limit=10):
+    """Find the verses most semantically similar to a free-text query.
+
+    Args:
+        query: Natural-language search text.
+        translation: Translation source to search (e.g. ``"KJV"``).
+        limit: Maximum number of verses to return.
+
+    Returns:
+        A list of dicts with book_name, chapter_num, verse_num, verse_text,
+        translation_source and similarity (cosine, 1.0 = identical),
+        ordered most-similar first. Empty list on failure.
+    """
+    # Purely diagnostic; skipped entirely unless DEBUG logging is on, and
+    # served from the TTL cache even then.
+    if logger.isEnabledFor(logging.DEBUG):
+        log_available_translations()
+
+    embedding = get_embedding(query)
+    if embedding is None:
+        logger.error("Could not get embedding for query: %s", query)
+        return []
+    # Guarded and deferred: never stringify a 1024-float list unless a
+    # handler actually wants DEBUG records.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Semantic search embedding for query %r: %s", query, embedding)
+
+    # Binary pgvector wire format: ~4x fewer bytes than the ASCII
+    # "[x,y,...]" form and no server-side float parsing.
+    embedding_vec = np.asarray(embedding, dtype=np.float32)
+
+    cached = _SEARCH_CACHE.lookup(query, embedding_vec, (translation, limit))
+    if cached is not None:
+        logger.info("Semantic cache hit for query %r", query)
+        return [dict(r) for r in cached]
+
+    try:
+        with _acquire_read_conn() as conn:
+            verse_results = _run_similarity_query(conn, embedding_vec, translation, limit)
+        logger.info("Found %d verses for query %r", len(verse_results), query)
+        _SEARCH_CACHE.add(query, embedding_vec, (translation, limit), verse_results)
+        return verse_results
+    except Exception as e:
+        logger.error("Error during semantic search: %s", e)
+        return []
+
+
+def _run_similarity_query(conn, embedding_vec, translation, limit):
+    """Run the pgvector ANN query on one connection; returns row dicts."""
+    with conn.cursor(row_factory=dict_row, binary=True) as cursor:
+        # Named placeholders send the embedding once as a single server-side
+        # parameter, and prepare=True keeps the parsed/planned statement
+        # cached on the connection across calls. The registered pgvector
+        # adapter ships the query vector in binary, and the ::float8 cast
+        # makes similarity arrive as a plain Python float.
+        #
+        # The default translation (nearly every call) targets its list
+        # partition directly: no translation filter to plan or apply, and
+        # the scan runs against that partition's own HNSW index.
+        if translation == DEFAULT_TRANSLATION and translation.isalnum():
+            search_query = sql.SQL(
+                """
+                SELECT v.book_name, v.chapter_num, v.verse_num, v.verse_text,
+                       ve.translation_source,
+                       (1 - (ve.embedding <=> %(embedding)s))::float8 AS similarity
+                FROM {} ve
+                JOIN bible.verses v ON ve.verse_id = v.id
+                ORDER BY ve.embedding <=> %(embedding)s
+                LIMIT %(limit)s
+                """
+            ).format(
+                sql.Identifier("bible", f"verse_embeddings_{translation.lower()}")
+            )
+            params = {"embedding": embedding_vec, "limit": limit}
+        else:
+            search_query = """
+                SELECT v.book_name, v.chapter_num, v.verse_num, v.verse_text,
+                       ve.translation_source,
+                       (1 - (ve.embedding <=> %(embedding)s))::float8 AS similarity
+                FROM bible.verse_embeddings ve
+                JOIN bible.verses v ON ve.verse_id = v.id
+                WHERE ve.translation_source = %(translation)s
+                ORDER BY ve.embedding <=> %(embedding)s
+                LIMIT %(limit)s
+            """
+            params = {
+                "embedding": embedding_vec,
+                "translation": translation,
+                "limit": limit,
+            }
+        cursor.execute(search_query, params, prepare=True)
+        return cursor.fetchall()
+
+
+def top_k_by_cosine(matrix, query_vec, k):
+    """Rank rows of an embedding matrix against a query vector, vectorized.
+
+    Intended for large-limit post-processing (e.g. reranking a few hundred
+    candidate verses client-side): one BLAS matrix-vector product and an
+    argpartition replace a per-row Python similarity loop.
+
+    Args:
+        matrix: (N, D) array-like of candidate embeddings.
+        query_vec: (D,) array-like query embedding.
+        k: Number of top rows to return.
+
+    Returns:
+        ``(indices, similarities)`` — both NumPy arrays of length
+        ``min(k, N)``, ordered most-similar first.
+    """
+    mat = np.asarray(matrix, dtype=np.float32)
+    q = np.asarray(query_vec, dtype=np.float32)
+    norms = np.linalg.norm(mat, axis=1) * np.linalg.norm(q)
+    sims = (mat @ q) / np.maximum(norms, 1e-12)
+    if k >= sims.shape[0]:
+        order = np.argsort(-sims)
+    else:
+        top = np.argpartition(-sims, k)[:k]
+        order = top[np.argsort(-sims[top])]
+    return order, sims[order]
+
+
+def rerank_with_cache(candidate_embeddings, query_vec, k):
+    """Rerank candidate embeddings against a query with the JIT kernels.
+
+    Normalizes both sides and scores rows in parallel via the Numba
+    kernels in vector_ops; falls back to the BLAS path when Numba is not
+    installed. Returns ``(indices, similarities)`` like top_k_by_cosine.
+    """
+    mat = np.ascontiguousarray(candidate_embeddings, dtype=np.float32)
+    q = np.ascontiguousarray(query_vec, dtype=np.float32)
+    k = min(k, mat.shape[0])
+    if vector_ops.NUMBA_AVAILABLE:
+        return vector_ops.cosine_topk(
+            vector_ops.normalize_2d(mat), vector_ops.normalize_1d(q), k
+        )
+    return top_k_by_cosine(mat, q, k)
+
+
+# Book names are a small, static set; loading them once lets reference
+# lookups reject bad book names without any database round-trip.
+_book_names = None
+_book_names_lock = threading.Lock()
+
+
+def _get_book_names():
+    global _book_names
+    if _book_names is None:
+        with _book_names_lock:
+            if _book_names is None:
+                try:
+                    with _acquire_read_conn() as conn:
+                        with conn.cursor(binary=True) as cursor:
+                            cursor.execute("SELECT name FROM bible.books")
+                            _book_names = frozenset(
+                                name for (name,) in cursor.fetchall()
+                            )
+                except Exception as e:
+                    logger.warning("Could not load book names: %s", e)
+                    return None
+    return _book_names
+
+
+def get_verse_by_reference(book_name, chapter_num, verse_num, translation="KJV"):
+    """Fetch one verse by its exact reference, or None if not found."""
+    known_books = _get_book_names()
+    if known_books is not None and book_name not in known_books:
+        logger.info("Unknown book name: %s", book_name)
+        return None
+    try:
+        with _acquire_read_conn() as conn:
+            return _fetch_verse_row(
+                conn, book_name, chapter_num, verse_num, translation
+            )
+    except Exception as e:
+        logger.error("Error fetching verse %s %s:%s: %s", book_name, chapter_num, verse_num, e)
+        return None
+
+
+def _fetch_verse_row(conn, book_name, chapter_num, verse_num, translation):
+    # No join: the uniqueness of (translation, book, chapter, verse) plus
+    # the cached book-name validation make the bible.books existence
+    # check redundant, so this is a single index lookup.
+    with conn.cursor(row_factory=dict_row, binary=True) as cursor:
+        cursor.execute(
+            """
+            SELECT v.book_name, v.chapter_num, v.verse_num, v.verse_text,
+                   v.translation_source
+            FROM bible.verses v
+            WHERE v.translation_source = %s AND v.book_name = %s
+              AND v.chapter_num = %s AND v.verse_num = %s
+            """,
+            (translation, book_name, chapter_num, verse_num),
+        )
+        return cursor.fetchone()
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import os
+
+    os.makedirs("logs", exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler("logs/vector_search.log"),
+            logging.StreamHandler(),
+        ],
+    )
+
+    import sys
+
+    parser = argparse.ArgumentParser(description="Semantic Bible verse search")
+    parser.add_argument("--query", help="Free-text search query")
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Read one query per line from stdin (one interpreter for N queries)",
+    )
+    parser.add_argument(
+        "--translation", default=DEFAULT_TRANSLATION, help="Translation source"
+    )
+    parser.add_argument("--limit", type=int, default=10, help="Max verses to return")
+    args = parser.parse_args()
+    if not args.query and not args.stdin:
+        parser.error("one of --query or --stdin is required")
+
+    def _run(query):
+        verses = search_verses_by_semantic_similarity(
+            query, translation=args.translation, limit=args.limit
+        )
+        print(json.dumps(verses, indent=2, ensure_ascii=False))
+
+    if args.stdin:
+        # Batch mode: pipelines pipe many queries through one process
+        # instead of paying interpreter + import startup per query.
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                _run(line)
+    else:
+        _run(args.query)
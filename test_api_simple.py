@@ -0,0 +1,34 @@
+"""Minimal Flask API for exercising semantic search end to end.
+
+Run with ``python test_api_simple.py`` and hit ``/insights`` with
+``{"query": "..."}`` to get the top matching verses.
+"""
+
+from flask import Flask, jsonify, request
+
+from src.utils.vector_search import search_verses_by_semantic_similarity
+
+app = Flask(__name__)
+
+
+@app.route("/health")
+def health():
+    return jsonify({"status": "ok"})
+
+
+@app.route("/insights", methods=["POST"])
+def insights():
+    payload = request.get_json(force=True, silent=True) or {}
+    query = payload.get("query", "")
+    if not query.strip():
+        return jsonify({"error": "query is required"}), 400
+    translation = payload.get("translation", "KJV")
+    limit = int(payload.get("limit", 10))
+    verses = search_verses_by_semantic_similarity(
+        query, translation=translation, limit=limit
+    )
+    return jsonify({"query": query, "verses": verses})
+
+
+if __name__ == "__main__":
+    app.run(host="127.0.0.1", port=5000, threaded=True)
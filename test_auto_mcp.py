@@ -0,0 +1,30 @@
+"""Smoke test: the MCP server initializes and lists its tools."""
+
+from mcp_session import get_session
+
+
+def test_initialize_and_list():
+    session = get_session()
+    init_response, list_response = session.request_batch(
+        [
+            (
+                "initialize",
+                {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {"name": "test_auto_mcp", "version": "1.0"},
+                },
+            ),
+            ("tools/list", {}),
+        ]
+    )
+    server_name = init_response["result"]["serverInfo"]["name"]
+    tools = list_response["result"]["tools"]
+    print(f"Server: {server_name}")
+    print(f"Tools available: {len(tools)}")
+    assert tools, "server reported no tools"
+
+
+if __name__ == "__main__":
+    test_initialize_and_list()
+    print("test_auto_mcp: OK")
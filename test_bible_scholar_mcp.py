@@ -0,0 +1,41 @@
+"""Checks the Bible Scholar quick tools over the shared MCP session."""
+
+from mcp_session import get_session
+
+
+def test_initialize():
+    response = get_session().request(
+        "initialize",
+        {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "test_bible_scholar_mcp", "version": "1.0"},
+        },
+    )
+    assert "result" in response
+
+
+def test_quick_database_check():
+    payload = get_session().call_tool("quick_database_check")
+    print(f"quick_database_check: {payload.get('message')}")
+    assert payload.get("status") in ("success", "error")
+
+
+def test_quick_server_status():
+    payload = get_session().call_tool("quick_server_status")
+    print(f"quick_server_status: {payload.get('message')}")
+    assert payload.get("status") in ("success", "warning")
+
+
+def test_system_instructions():
+    payload = get_session().call_tool("get_system_instructions")
+    print(f"quick functions: {len(payload.get('quick_functions', []))}")
+    assert payload.get("status") == "success"
+
+
+if __name__ == "__main__":
+    test_initialize()
+    test_quick_database_check()
+    test_quick_server_status()
+    test_system_instructions()
+    print("test_bible_scholar_mcp: OK")
@@ -0,0 +1,57 @@
+"""Exercises the routed execute_operation tool end to end over MCP."""
+
+from mcp_session import get_session
+
+
+def test_initialize():
+    response = get_session().request(
+        "initialize",
+        {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "test_comprehensive_mcp", "version": "1.0"},
+        },
+    )
+    assert "result" in response
+
+
+def test_database_stats_operation():
+    payload = get_session().call_tool(
+        "execute_operation",
+        {
+            "domain": "data",
+            "operation": "check",
+            "target": "database_stats",
+            "action_params": {},
+        },
+    )
+    print(f"database_stats: {payload.get('status')}")
+    assert payload.get("status") in ("success", "error")
+
+
+def test_port_check_operation():
+    payload = get_session().call_tool(
+        "execute_operation",
+        {
+            "domain": "system",
+            "operation": "check",
+            "target": "ports",
+            "action_params": {},
+        },
+    )
+    print(f"port check: {payload.get('status')}")
+    assert payload.get("status") == "success"
+
+
+def test_help():
+    payload = get_session().call_tool("help_mcp")
+    print(f"operations registered: {len(payload.get('operations', []))}")
+    assert payload.get("status") == "success"
+
+
+if __name__ == "__main__":
+    test_initialize()
+    test_database_stats_operation()
+    test_port_check_operation()
+    test_help()
+    print("test_comprehensive_mcp: OK")
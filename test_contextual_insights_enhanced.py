@@ -0,0 +1,357 @@
+"""Driver for the enhanced contextual-insights pipeline.
+
+Runs a verse, a question and a topic query through
+quick_contextual_insights, validates the response shape, and saves each
+full result to a test_result_*.json file for inspection.
+"""
+
+import io
+import json
+import re
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style: every attribute is ''."""
+
+    def __getattr__(self, name):
+        return ""
+
+
+# colorama binds the Win32 console (DLL loads, stdout patching) the
+# moment init() runs, which is pure overhead when this module is merely
+# imported during test collection. The no-color shims are swapped for
+# the real thing lazily, only once an entry point actually runs.
+Fore = Style = _NoColor()
+_colors_initialized = False
+
+
+def _init_colors():
+    global Fore, Style, _colors_initialized
+    if _colors_initialized:
+        return
+    _colors_initialized = True
+    try:
+        import colorama
+
+        colorama.init(autoreset=True)
+        Fore, Style = colorama.Fore, colorama.Style
+    except ImportError:
+        pass
+
+
+# Response-shape validation: msgspec checks the whole envelope in one
+# C-level pass and raises with a precise path on the first violation.
+# The hand-rolled dict checks stay as the fallback implementation.
+try:
+    import msgspec
+
+    class _InsightInput(msgspec.Struct):
+        reference: str
+        type: str
+
+    class _InsightResponse(msgspec.Struct):
+        input: _InsightInput
+        insights: dict
+        processing_time_seconds: float
+
+    def _validate_response(result):
+        """Return None when result matches the schema, else an error string."""
+        try:
+            msgspec.convert(result, _InsightResponse)
+        except msgspec.ValidationError as exc:
+            return str(exc)
+        return None
+except ImportError:
+    def _validate_response(result):
+        missing = [
+            f
+            for f in ("input", "insights", "processing_time_seconds")
+            if f not in result
+        ]
+        if missing:
+            return f"missing required fields: {missing}"
+        input_section = result["input"]
+        if "reference" not in input_section or "type" not in input_section:
+            return "input section incomplete"
+        return None
+
+
+API_BASE_URL = "http://localhost:5200"
+
+# One-pass filename sanitization for the saved result files; also drops
+# path separators so a crafted query can't escape the output directory.
+_FILENAME_TABLE = str.maketrans({" ": "_", ":": "_", "?": None, "/": "_", "\\": "_"})
+
+# Field classification dispatched on exact type(): one dict lookup per
+# field instead of up to three isinstance probes. Exact types are safe
+# here because the values come straight from a JSON decoder.
+_FIELD_KIND = {
+    list: lambda v: ("list", len(v)),
+    dict: lambda v: ("dict", len(v)),
+    str: lambda v: ("str", len(v.strip())),
+}
+
+# One pooled session for the whole driver: sockets to the API are
+# reused across calls instead of a fresh TCP handshake each time.
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
+SESSION.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+
+_OT_BOOK_ABBREVS = (
+    "Gen", "Exo", "Lev", "Num", "Deu", "Jos", "Jdg", "Rut", "1Sa", "2Sa",
+    "1Ki", "2Ki", "1Ch", "2Ch", "Ezr", "Neh", "Est", "Job", "Psa", "Pro",
+    "Ecc", "Sng", "Isa", "Jer", "Lam", "Eze", "Dan", "Hos", "Joe", "Amo",
+    "Oba", "Jon", "Mic", "Nah", "Hab", "Zep", "Hag", "Zec", "Mal",
+)
+
+# Multi-pattern matching for the OT filter: pyahocorasick builds one DFA
+# over all book abbreviations and scans each ref in O(len(ref))
+# regardless of how many books we track. The compiled-regex alternation
+# stays as the fallback when the C extension isn't installed.
+try:
+    import ahocorasick
+
+    _OT_AUTOMATON = ahocorasick.Automaton()
+    for _abbrev in _OT_BOOK_ABBREVS:
+        _OT_AUTOMATON.add_word(_abbrev, _abbrev)
+    _OT_AUTOMATON.make_automaton()
+
+    def _is_ot_reference(reference):
+        for _ in _OT_AUTOMATON.iter(reference):
+            return True
+        return False
+except ImportError:
+    _OT_BOOK_RE = re.compile("^(" + "|".join(_OT_BOOK_ABBREVS) + ")")
+
+    def _is_ot_reference(reference):
+        return _OT_BOOK_RE.match(reference) is not None
+
+test_queries = [
+    {
+        "query": "John 3:16",
+        "type": "verse",
+        "expected_features": [
+            "summary",
+            "theological_terms",
+            "cross_references",
+            "original_language_notes",
+            "translation_variants",
+        ],
+    },
+    {
+        "query": "What does John 1:1 say about the Word?",
+        "type": "question",
+        "expected_features": [
+            "summary",
+            "theological_terms",
+            "cross_references",
+            "original_language_notes",
+        ],
+    },
+    {
+        "query": "love your enemies",
+        "type": "topic",
+        "expected_features": ["summary", "theological_terms", "cross_references"],
+    },
+]
+
+
+# (monotonic timestamp, bool) of the last probe; entries expire after
+# _HEALTH_TTL seconds so repeated callers within one run skip the HTTP
+# round-trip but a long session still re-probes.
+_HEALTH_CACHE = None
+_HEALTH_TTL = 30.0
+_HEALTH_LOCK = threading.Lock()
+
+
+def test_api_server_status():
+    """Check the insights API is up before timing queries.
+
+    The result is memoized for 30s: every entry point probes health, and
+    only the first within that window should pay the round-trip.
+    """
+    global _HEALTH_CACHE
+    with _HEALTH_LOCK:
+        now = time.monotonic()
+        if _HEALTH_CACHE is not None and now - _HEALTH_CACHE[0] < _HEALTH_TTL:
+            return _HEALTH_CACHE[1]
+        try:
+            response = SESSION.get(f"{API_BASE_URL}/health", timeout=5)
+            ok = response.status_code == 200
+        except Exception:
+            ok = False
+        _HEALTH_CACHE = (now, ok)
+        return ok
+
+
+_quick_insights = None
+
+
+def _get_quick_insights():
+    """Import quick_contextual_insights once and warm it up once.
+
+    The first invocation pays one-time costs (engine init, embedding
+    model load, index mmap) that would otherwise distort whichever timed
+    query happens to run first.
+    """
+    global _quick_insights
+    if _quick_insights is None:
+        from mcp_tools import quick_contextual_insights
+
+        try:
+            quick_contextual_insights("warmup")
+        except Exception:
+            pass
+        _quick_insights = quick_contextual_insights
+    return _quick_insights
+
+
+def _run_one(test_case):
+    """Time one quick_contextual_insights call; returns (case, elapsed, result)."""
+    quick_contextual_insights = _get_quick_insights()
+
+    # perf_counter is monotonic and ~ns resolution; time.time can step
+    # with clock adjustments and only resolves ~15ms on Windows.
+    start_time = time.perf_counter()
+    result = quick_contextual_insights(test_case["query"])
+    elapsed = time.perf_counter() - start_time
+    return test_case, elapsed, result
+
+
+def _analyze_result(test_case, elapsed, result):
+    # All per-query output is buffered and written in one syscall at the
+    # end: N console writes (expensive under colorama's wrapped stdout)
+    # collapse into one, and blocks from concurrent queries can't
+    # interleave mid-report.
+    buf = io.StringIO()
+
+    def pr(line=""):
+        buf.write(line + "\n")
+
+    try:
+        pr(f"\n{Fore.YELLOW}Query: {test_case['query']} ({elapsed:.3f}s)")
+
+        schema_error = _validate_response(result)
+        if schema_error:
+            pr(f"{Fore.RED}❌ Response schema check failed: {schema_error}")
+            return
+
+        insights = result["insights"]
+        expected_insight_fields = [
+            "summary",
+            "theological_terms",
+            "cross_references",
+            "original_language_notes",
+            "translation_variants",
+        ]
+
+        # One traversal of the insights dict classifies every field as
+        # (kind, size); the presence count and the per-feature report
+        # below both consult this summary instead of re-inspecting the
+        # dict with their own type checks.
+        field_summary = {}
+        for key, value in insights.items():
+            classify = _FIELD_KIND.get(type(value))
+            field_summary[key] = (
+                classify(value) if classify else ("other", 1 if value else 0)
+            )
+
+        present_fields = [
+            f for f in expected_insight_fields if field_summary.get(f, ("", 0))[1] > 0
+        ]
+        pr(f"   Present fields: {len(present_fields)}/{len(expected_insight_fields)}")
+
+        feature_results = []
+        for feature in test_case["expected_features"]:
+            entry = field_summary.get(feature)
+            if entry is None:
+                feature_results.append(f"❌ {feature}: missing")
+            elif entry[1] == 0:
+                feature_results.append(f"⚠️ {feature}: empty")
+            elif entry[0] == "list":
+                feature_results.append(f"✅ {feature}: {entry[1]} items")
+            else:
+                feature_results.append(f"✅ {feature}: present")
+        for line in feature_results:
+            pr(f"   {line}")
+
+        cross_refs = insights.get("cross_references", [])
+        if "John 1:1" in test_case["query"]:
+            ot_refs = [ref for ref in cross_refs if _is_ot_reference(ref.get("reference", ""))]
+            pr(f"   OT cross-references: {len(ot_refs)}")
+
+        # One pass over the notes instead of a comprehension per language.
+        lang_counts = {"Greek": 0, "Hebrew": 0}
+        for note in insights.get("original_language_notes", []):
+            lang = note.get("language")
+            if lang in lang_counts:
+                lang_counts[lang] += 1
+        pr(f"   Greek notes: {lang_counts['Greek']}, Hebrew notes: {lang_counts['Hebrew']}")
+
+        output_file = f"test_result_{test_case['query'].translate(_FILENAME_TABLE)}.json"
+        if orjson is not None:
+            # C-accelerated encoder: ~5-10x faster than stdlib json on these
+            # nested dicts with Greek/Hebrew strings, written as bytes.
+            with open(output_file, "wb") as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
+        pr(f"   {Fore.GREEN}Saved: {output_file}")
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
+def test_contextual_insights_enhanced():
+    _init_colors()
+    print(f"{Fore.CYAN}=== Enhanced Contextual Insights Test ==={Style.RESET_ALL}")
+
+    # Warm up before any query is timed so cold-start cost is paid here,
+    # not inside whichever future runs first.
+    _get_quick_insights()
+
+    # The three queries are independent and I/O-bound (HTTP + DB +
+    # embedding latency), so run them concurrently: wall time collapses
+    # to roughly the slowest single query.
+    with ThreadPoolExecutor(max_workers=len(test_queries)) as executor:
+        futures = {
+            executor.submit(_run_one, test_case): test_case
+            for test_case in test_queries
+        }
+        for future in as_completed(futures):
+            try:
+                test_case, elapsed, result = future.result()
+            except Exception:
+                print(f"{Fore.RED}❌ Query failed: {futures[future]['query']}")
+                traceback.print_exc()
+                continue
+            _analyze_result(test_case, elapsed, result)
+
+
+if __name__ == "__main__":
+    _init_colors()
+    if not test_api_server_status():
+        print(f"{Fore.YELLOW}⚠️ Insights API not reachable at {API_BASE_URL}; continuing with direct calls")
+    test_contextual_insights_enhanced()
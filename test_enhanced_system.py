@@ -0,0 +1,128 @@
+"""End-to-end checks against the running contextual-insights API."""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+API_BASE_URL = "http://localhost:5000"
+INSIGHTS_URL = f"{API_BASE_URL}/api/contextual_insights/insights"
+
+_session = None
+
+
+def _get_session():
+    """Build the shared pooled session on first use.
+
+    Importing requests (and urllib3 behind it) is deferred to the first
+    real HTTP call so importing this module — e.g. during test
+    collection — stays cheap. The concurrent tests still reuse
+    keep-alive sockets from one urllib3 pool rather than handshaking
+    per call.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _session = requests.Session()
+        _session.mount(
+            "http://",
+            HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
+        _session.headers.update(
+            {"Connection": "keep-alive", "Accept-Encoding": "gzip"}
+        )
+    return _session
+
+
+def test_server_health():
+    try:
+        response = _get_session().get(f"{API_BASE_URL}/health", timeout=5)
+        return response.status_code == 200
+    except Exception:
+        return False
+
+
+def test_tahot_integration():
+    """Hebrew OT (TAHOT) queries should resolve and carry language notes."""
+    response = _get_session().post(
+        INSIGHTS_URL,
+        json={"query": "Genesis 1:1", "translation": "TAHOT"},
+        timeout=60,
+    )
+    if response.status_code != 200:
+        return False, f"HTTP {response.status_code}"
+    data = response.json()
+    notes = data.get("insights", {}).get("original_language_notes", [])
+    return True, f"{len(notes)} original-language notes"
+
+
+def test_comprehensive_search():
+    """Topic queries should return a populated cross-reference list."""
+    response = _get_session().post(
+        INSIGHTS_URL,
+        json={"query": "In the beginning God created"},
+        timeout=60,
+    )
+    if response.status_code != 200:
+        return False, f"HTTP {response.status_code}"
+    data = response.json()
+    refs = data.get("insights", {}).get("cross_references", [])
+    return len(refs) > 0, f"{len(refs)} cross-references"
+
+
+def test_cross_references():
+    """John 1:1 should cross-reference both Genesis and John."""
+    response = _get_session().post(
+        INSIGHTS_URL,
+        json={"query": "John 1:1"},
+        timeout=60,
+    )
+    if response.status_code != 200:
+        return False, f"HTTP {response.status_code}"
+    data = response.json()
+    cross_refs = data.get("insights", {}).get("cross_references", [])
+    # str(ref) serializes the whole ref dict; do it once per ref and scan
+    # the joined blob with single C-level substring searches instead of
+    # re-stringifying inside each any() generator.
+    blob = "\n".join(str(ref) for ref in cross_refs)
+    genesis_found = "Genesis" in blob or "Gen" in blob
+    john_found = "John" in blob or "Jhn" in blob
+    return genesis_found and john_found, (
+        f"Genesis: {genesis_found}, John: {john_found}"
+    )
+
+
+def main():
+    if not test_server_health():
+        print(f"❌ API server not reachable at {API_BASE_URL}")
+        return 1
+
+    tests = [
+        ("tahot_integration", test_tahot_integration),
+        ("comprehensive_search", test_comprehensive_search),
+        ("cross_references", test_cross_references),
+    ]
+
+    # Each test is an independent HTTP round-trip; overlapping them cuts
+    # suite wall time to approximately the slowest request.
+    failures = 0
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {executor.submit(fn): name for name, fn in tests}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                ok, detail = future.result()
+            except Exception as e:
+                ok, detail = False, str(e)
+            print(f"{'✅' if ok else '❌'} {name}: {detail}")
+            if not ok:
+                failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+"""Protocol-level test: boots the MCP server and drives raw JSON-RPC.
+
+Unlike the harnesses built on mcp_session, this intentionally owns its
+own subprocess so server boot and first-contact framing stay covered.
+"""
+
+import asyncio
+import json
+import sys
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads  # accepts bytes/str, tolerates the trailing newline
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+RESPONSE_TIMEOUT = 10.0
+
+# The requests never vary between runs, so they are serialized once at
+# import time into the exact bytes written to the server; the function
+# body does no JSON encoding at all.
+_BATCH_IDS = (1, 2, 3)
+_BATCH_PAYLOAD = "".join(
+    _dumps(r) + "\n"
+    for r in (
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "test_mcp_protocol", "version": "1.0"},
+            },
+        },
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}},
+        {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "method": "tools/call",
+            "params": {"name": "quick_server_status", "arguments": {}},
+        },
+    )
+).encode()
+
+
+async def test_mcp_server():
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "mcp_universal_operations.py",
+        "--mcp",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    try:
+        # Pipelined dispatch: the ids are distinct, so all three requests
+        # go out in one write and the server processes them back to back.
+        # Non-blocking I/O lets the write overlap response parsing, and
+        # wait_for bounds every read so a crashed or silent server fails
+        # the test instead of hanging it.
+        process.stdin.write(_BATCH_PAYLOAD)
+        await process.stdin.drain()
+
+        responses = {}
+        for _ in _BATCH_IDS:
+            line = await asyncio.wait_for(
+                process.stdout.readline(), timeout=RESPONSE_TIMEOUT
+            )
+            if not line:
+                raise AssertionError("MCP server closed stdout mid-batch")
+            response = _loads(line)
+            responses[response["id"]] = response
+    finally:
+        process.terminate()
+        await process.wait()
+
+    assert "result" in responses[1], f"initialize failed: {responses[1]}"
+    tools = responses[2]["result"]["tools"]
+    print(f"tools/list returned {len(tools)} tools")
+    assert tools
+    assert "result" in responses[3], f"tools/call failed: {responses[3]}"
+    print("tools/call quick_server_status returned a result")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_mcp_server())
+    print("test_mcp_protocol: OK")
@@ -0,0 +1,77 @@
+"""Minimal MCP smoke test: initialize and list tools over stdio."""
+
+import asyncio
+import json
+import sys
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads  # accepts bytes/str, tolerates the trailing newline
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+RESPONSE_TIMEOUT = 10.0
+
+# Static requests, serialized once at import time into the bytes that
+# go over the wire.
+_BATCH_IDS = (1, 2)
+_BATCH_PAYLOAD = "".join(
+    _dumps(r) + "\n"
+    for r in (
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "test_minimal_mcp", "version": "1.0"},
+            },
+        },
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}},
+    )
+).encode()
+
+
+async def test_minimal_server():
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "mcp_universal_operations.py",
+        "--mcp",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    try:
+        # Both requests in one write; every read is bounded so a dead
+        # server fails fast instead of blocking readline forever.
+        process.stdin.write(_BATCH_PAYLOAD)
+        await process.stdin.drain()
+
+        responses = {}
+        for _ in _BATCH_IDS:
+            line = await asyncio.wait_for(
+                process.stdout.readline(), timeout=RESPONSE_TIMEOUT
+            )
+            if not line:
+                raise AssertionError("MCP server closed stdout mid-batch")
+            response = _loads(line)
+            responses[response["id"]] = response
+    finally:
+        process.terminate()
+        await process.wait()
+
+    assert "result" in responses[1]
+    assert responses[2]["result"]["tools"]
+    print(f"minimal server OK, {len(responses[2]['result']['tools'])} tools")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_minimal_server())
+    print("test_minimal_mcp: OK")
@@ -0,0 +1,54 @@
+"""Workspace-level checks for the universal MCP router.
+
+Imports the router directly and drives execute_operation the way agent
+tooling does, including one batched probe of every workspace port.
+"""
+
+import sys
+
+# Set before the first project import; see test_new_mcp_functions.py.
+sys.dont_write_bytecode = True
+
+from mcp_probes import DB_STATS_PROBE, PORTS_PROBE  # noqa: E402
+from mcp_universal_operations import execute_operation, universal_router  # noqa: E402
+
+
+def test_router_import():
+    n_ops = len(universal_router.operation_registry)
+    # One write per block instead of one per line; see _run_check in
+    # test_new_mcp_functions.py for the same pattern.
+    sys.stdout.write(f"1. router import\n   Registered operations: {n_ops}\n")
+    return n_ops > 0
+
+
+def test_database_stats():
+    result = execute_operation(DB_STATS_PROBE)
+    sys.stdout.write(
+        "2. data.check.database_stats\n"
+        f"   Status: {result.get('status', 'unknown')}\n"
+    )
+    return result.get("status") in ("success", "error")
+
+
+def test_port_check():
+    # One routed call probes every workspace port in a single batch
+    # instead of one execute_operation round per port.
+    result = execute_operation(PORTS_PROBE)
+    sys.stdout.write(
+        "3. system.check.ports\n"
+        f"   Status: {result.get('status', 'unknown')}\n"
+        f"   Ports: {result.get('ports', {})}\n"
+    )
+    return result.get("status") == "success"
+
+
+def main():
+    print("=== Workspace MCP Checks ===")
+    results = [test_router_import(), test_database_stats(), test_port_check()]
+    passed = sum(results)
+    print(f"\n{passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+"""Assess whether the BSPclean venv and workspace are in a usable state.
+
+Reports which interpreter is active, whether the key dependencies
+import, and where stale ``__pycache__`` directories are accumulating.
+"""
+
+import sys
+
+# The assessment reports stale __pycache__ dirs; don't create fresh
+# ones while running it. PYTHONPYCACHEPREFIX=/tmp/bsp-pyc is the
+# alternative when bytecode caching is wanted off-tree.
+sys.dont_write_bytecode = True
+
+import importlib.util  # noqa: E402
+import os  # noqa: E402
+import shutil  # noqa: E402
+import subprocess  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+# Presence is checked via find_spec, not import: langchain and dspy pull
+# in hundreds of modules (seconds of import, tens of MB RSS) that this
+# assessment never uses.
+_KEY_PACKAGES = ("psycopg", "langchain", "dspy")
+
+# Directories that either are the target itself or can never contain a
+# workspace __pycache__ worth reporting; pruning them keeps the scan to
+# the project's own source tree.
+_PRUNE_DIRS = {"__pycache__", ".git", "node_modules", "venv", ".venv", "BSPclean"}
+_MAX_HITS = 100
+
+
+def check_interpreter():
+    print("1. interpreter")
+    executable = sys.executable
+    print(f"   Executable: {executable}")
+    # Compare the venv directory name itself (python sits two levels
+    # below it) rather than substring-scanning the whole path, which
+    # also avoids false positives from e.g. a BSPclean-backup sibling.
+    in_venv = Path(executable).parents[1].name == "BSPclean"
+    print(f"   BSPclean venv active: {in_venv}")
+    return in_venv
+
+
+def check_imports():
+    print("2. key packages")
+    missing = [m for m in _KEY_PACKAGES if importlib.util.find_spec(m) is None]
+    for name in _KEY_PACKAGES:
+        mark = "❌" if name in missing else "✅"
+        print(f"   {mark} {name}")
+    return not missing
+
+
+def find_pycache_dirs(root="."):
+    """Collect up to _MAX_HITS __pycache__ paths, via fd when installed.
+
+    fd walks directories in parallel native code, typically 5-20x
+    faster than any Python-level walk on a big checkout. Without it,
+    the pruned scandir DFS below is still well ahead of rglob because
+    pruned subtrees are never read at all.
+    """
+    fd = shutil.which("fd")
+    if fd is not None:
+        try:
+            out = subprocess.run(
+                [fd, "-HI", "-t", "d", "^__pycache__$", root],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            if out.returncode == 0:
+                hits = out.stdout.splitlines()
+                prune = _PRUNE_DIRS - {"__pycache__"}
+                return [
+                    p
+                    for p in hits
+                    if not prune.intersection(p.split(os.sep))
+                ][:_MAX_HITS]
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+    hits = []
+    stack = [root]
+    while stack and len(hits) < _MAX_HITS:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if entry.name == "__pycache__":
+                        hits.append(entry.path)
+                        if len(hits) >= _MAX_HITS:
+                            break
+                    elif entry.name not in _PRUNE_DIRS:
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return hits
+
+
+def check_pycache():
+    print("3. stale __pycache__ directories")
+    hits = find_pycache_dirs()
+    print(f"   Found: {len(hits)}{'+' if len(hits) >= _MAX_HITS else ''}")
+    for path in hits[:5]:
+        print(f"   {path}")
+    return True
+
+
+def check_mcp_router():
+    print("4. MCP router probes")
+    try:
+        from mcp_probes import DB_STATS_PROBE, PORTS_PROBE
+        from mcp_universal_operations import execute_operation
+
+        stats = execute_operation(DB_STATS_PROBE)
+        ports = execute_operation(PORTS_PROBE)
+        print(f"   database_stats: {stats.get('status', 'unknown')}")
+        print(f"   ports: {ports.get('ports', {})}")
+        return ports.get("status") == "success"
+    except Exception as e:
+        print(f"   ❌ {e}")
+        return False
+
+
+def main():
+    print("=== venv Damage Assessment ===")
+    results = [
+        check_interpreter(),
+        check_imports(),
+        check_pycache(),
+        check_mcp_router(),
+    ]
+    passed = sum(results)
+    print(f"\n{passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())